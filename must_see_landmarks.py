@@ -3,7 +3,10 @@ Must-see landmarks database for major Andalusian cities.
 Ensures world-famous attractions are prioritized in itineraries.
 """
 
-MUST_SEE_LANDMARKS = {
+import re
+from types import MappingProxyType
+
+_MUST_SEE_LANDMARKS_RAW = {
     "Granada": [
         "Alhambra",
         "Generalife",
@@ -115,6 +118,28 @@ MUST_SEE_LANDMARKS = {
     ]
 }
 
+# Read-only view with tuple values: callers can share these references
+# directly without defensive copies.
+MUST_SEE_LANDMARKS = MappingProxyType({
+    city: tuple(landmarks) for city, landmarks in _MUST_SEE_LANDMARKS_RAW.items()
+})
+
+# Accent folding table so "Alcazar" (OSM) matches "Alcázar" and vice versa
+_FOLD = str.maketrans('áéíóúñüÁÉÍÓÚÑÜ', 'aeiounuAEIOUNU')
+
+# Lowercased, accent-folded copies of the landmark names, computed once at
+# import so the matching helpers below don't redo it on every call.
+MUST_SEE_LANDMARKS_FOLDED = MappingProxyType({
+    city: tuple(landmark.lower().translate(_FOLD) for landmark in landmarks)
+    for city, landmarks in MUST_SEE_LANDMARKS.items()
+})
+
+# One alternation pattern per city for the vectorized batch counter.
+MUST_SEE_PATTERNS = MappingProxyType({
+    city: '|'.join(re.escape(landmark) for landmark in landmarks_folded)
+    for city, landmarks_folded in MUST_SEE_LANDMARKS_FOLDED.items()
+})
+
 
 def is_must_see(poi_name, city_name):
     """
@@ -127,14 +152,17 @@ def is_must_see(poi_name, city_name):
     Returns:
         bool: True if the POI is a must-see landmark
     """
-    if city_name not in MUST_SEE_LANDMARKS:
+    landmarks_folded = MUST_SEE_LANDMARKS_FOLDED.get(city_name)
+    if not landmarks_folded:
         return False
     
-    landmarks = MUST_SEE_LANDMARKS[city_name]
-    poi_lower = poi_name.lower()
+    poi_key = poi_name.lower().translate(_FOLD)
     
     # Check for substring matches (e.g., "Alhambra Palace" matches "Alhambra")
-    return any(landmark.lower() in poi_lower for landmark in landmarks)
+    for landmark_folded in landmarks_folded:
+        if landmark_folded in poi_key:
+            return True
+    return False
 
 
 def get_must_see_count(pois, city_name):
@@ -148,13 +176,36 @@ def get_must_see_count(pois, city_name):
     Returns:
         int: Number of must-see landmarks found
     """
-    if city_name not in MUST_SEE_LANDMARKS:
+    return get_must_see_count_names([poi.get('name', '') for poi in pois], city_name)
+
+
+def get_must_see_count_names(names, city_name):
+    """
+    Count how many must-see landmarks are included in a list of POI names.
+    
+    Same as get_must_see_count(), for callers that already hold the
+    extracted names and want to skip the per-POI dict lookups.
+    
+    Args:
+        names: List of POI name strings
+        city_name: Name of the city
+        
+    Returns:
+        int: Number of must-see landmarks found
+    """
+    # Single pass: resolve the city's landmarks once and fold each
+    # POI name once, instead of going through is_must_see() per POI.
+    landmarks_folded = MUST_SEE_LANDMARKS_FOLDED.get(city_name)
+    if not landmarks_folded:
         return 0
     
     count = 0
-    for poi in pois:
-        if is_must_see(poi.get('name', ''), city_name):
-            count += 1
+    for name in names:
+        poi_key = name.lower().translate(_FOLD)
+        for landmark_folded in landmarks_folded:
+            if landmark_folded in poi_key:
+                count += 1
+                break
     
     return count
 
@@ -170,15 +221,19 @@ def get_missing_must_sees(pois, city_name):
     Returns:
         list: Names of missing must-see landmarks
     """
-    if city_name not in MUST_SEE_LANDMARKS:
+    landmarks = MUST_SEE_LANDMARKS.get(city_name)
+    if not landmarks:
         return []
     
-    included_names = [poi.get('name', '').lower() for poi in pois]
+    included_names = [poi.get('name', '').lower().translate(_FOLD) for poi in pois]
     missing = []
     
-    for landmark in MUST_SEE_LANDMARKS[city_name]:
-        landmark_found = any(landmark.lower() in name for name in included_names)
-        if not landmark_found:
+    for landmark, landmark_folded in zip(landmarks,
+                                         MUST_SEE_LANDMARKS_FOLDED[city_name]):
+        for name in included_names:
+            if landmark_folded in name:
+                break
+        else:
             missing.append(landmark)
     
     return missing
@@ -192,6 +247,36 @@ def get_city_landmarks(city_name):
         city_name: Name of the city
         
     Returns:
-        list: List of landmark names, or empty list if city not found
+        tuple: Landmark names, or empty tuple if city not found
     """
-    return MUST_SEE_LANDMARKS.get(city_name, [])
+    return MUST_SEE_LANDMARKS.get(city_name, ())
+
+
+def count_must_sees_batch(df, city_col='city', name_col='name'):
+    """
+    Count must-see landmarks per city for a whole DataFrame of POIs at once.
+    
+    Equivalent to calling get_must_see_count() for each city's POIs, but
+    each city is matched with a single vectorized regex scan over its
+    name column instead of a Python loop per POI.
+    
+    Args:
+        df: pandas DataFrame of POIs
+        city_col: Column holding the city name
+        name_col: Column holding the POI name
+        
+    Returns:
+        dict: {city_name: number of must-see POIs}; cities without
+              landmark data count as 0
+    """
+    counts = {}
+    for city_name, group in df.groupby(city_col, sort=False):
+        pattern = MUST_SEE_PATTERNS.get(city_name)
+        if not pattern:
+            counts[city_name] = 0
+            continue
+        
+        names_folded = group[name_col].fillna('').astype(str).str.lower().str.translate(_FOLD)
+        counts[city_name] = int(names_folded.str.contains(pattern, regex=True).sum())
+    
+    return counts
@@ -52,22 +52,21 @@ st.markdown("""
 
 @st.cache_data
 def load_data():
-    """Load data from JSON files"""
-    with open('data/andalusia_attractions_clean.json', 'r', encoding='utf-8') as f:
-        attractions_data = json.load(f)
-    
+    """Load route data from JSON"""
     with open('data/andalusia_routes.json', 'r', encoding='utf-8') as f:
         routes_data = json.load(f)
     
-    return attractions_data, routes_data
+    return routes_data
 
 
-@st.cache_resource
+@st.cache_resource(show_spinner=False)
 def initialize_services():
-    """Initialize all services"""
-    attractions_data, routes_data = load_data()
+    """Initialize all services (built once per process, shared across reruns)"""
+    routes_data = load_data()
     
-    attraction_service = AttractionService(attractions_data)
+    # Reuses the cleaned DataFrame + indexes from the sidecar cache when the
+    # attractions JSON hasn't changed, so a fresh process skips the rebuild
+    attraction_service = AttractionService.from_json_file('data/andalusia_attractions_clean.json')
     route_service = RouteService(routes_data, attraction_service)
     filter_service = FilterService(attraction_service)
     
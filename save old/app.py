@@ -7,6 +7,9 @@ import streamlit as st
 import json
 import os
 
+from json_files import read_json_file, write_json_file
+from trips_index import INDEX_FILENAME, build_trips_index
+
 # Page configuration
 st.set_page_config(
     page_title="Wanderlust - Andalusia Road Trip Planner",
@@ -34,36 +37,46 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-def load_json(filepath):
-    """Load JSON data from file with better error reporting"""
+@st.cache_data(show_spinner=False)
+def _load_json_cached(filepath, mtime):
+    """
+    Read and check a JSON data file, cached across reruns
+    
+    The file's mtime is part of the cache key so an edited file is re-read.
+    Read errors propagate, and st.cache_data doesn't cache a call that
+    raises, so a failed read is retried on the next rerun.
+    """
+    file_size = os.path.getsize(filepath)
+    
+    data = read_json_file(filepath)
+    
+    if not data:
+        return [], ("warning", f"⚠️ File is empty: {filepath}")
+    
+    if not isinstance(data, list):
+        return [], ("warning", f"⚠️ File data is not a list: {filepath}")
+    
+    # Success - show info
+    return data, ("success", f"✅ Loaded {len(data):,} items from {os.path.basename(filepath)} ({file_size/1024:.0f} KB)")
+
+
+def load_json(filepath, mtime):
+    """
+    Load JSON data from file with better error reporting
+    
+    Status messages are returned instead of drawn here (cached functions
+    don't replay them reliably).
+    
+    Returns:
+        (data, (level, message)) - level is "success", "warning" or "error"
+    """
     try:
-        if not os.path.exists(filepath):
-            st.warning(f"⚠️ File not found: {filepath}")
-            return []
-        
-        file_size = os.path.getsize(filepath)
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        if not data:
-            st.warning(f"⚠️ File is empty: {filepath}")
-            return []
-        
-        if not isinstance(data, list):
-            st.warning(f"⚠️ File data is not a list: {filepath}")
-            return []
-        
-        # Success - show info
-        st.success(f"✅ Loaded {len(data):,} items from {os.path.basename(filepath)} ({file_size/1024:.0f} KB)")
-        return data
+        return _load_json_cached(filepath, mtime)
         
     except json.JSONDecodeError as e:
-        st.error(f"❌ JSON decode error in {filepath}: {str(e)}")
-        return []
+        return [], ("error", f"❌ JSON decode error in {filepath}: {str(e)}")
     except Exception as e:
-        st.error(f"❌ Error loading {filepath}: {str(e)}")
-        return []
+        return [], ("error", f"❌ Error loading {filepath}: {str(e)}")
 
 
 def main():
@@ -93,19 +106,33 @@ def main():
     def try_load(filename):
         """Try loading from current dir first, then data/ subdir"""
         if os.path.exists(filename):
-            return load_json(filename)
+            filepath = filename
         elif os.path.exists(f"data/{filename}"):
-            return load_json(f"data/{filename}")
+            filepath = f"data/{filename}"
         else:
-            st.error(f"❌ File not found: {filename} (checked current dir and data/ subdir)")
-            return []
+            return [], ("error", f"❌ File not found: {filename} (checked current dir and data/ subdir)")
+        
+        return load_json(filepath, os.path.getmtime(filepath))
     
     st.markdown("### 📂 Loading Data...")
     
-    attractions_data = try_load("andalusia_attractions_filtered.json")
-    hotels_data = try_load("andalusia_hotels_osm.json")
-    restaurants_data = try_load("restaurants_andalusia.json")
-    routes_data = try_load("andalusia_routes.json")
+    data_files = {
+        "attractions": "andalusia_attractions_filtered.json",
+        "hotels": "andalusia_hotels_osm.json",
+        "restaurants": "restaurants_andalusia.json",
+        "routes": "andalusia_routes.json",
+    }
+    
+    loaded = {}
+    for key, filename in data_files.items():
+        loaded[key] = try_load(filename)
+        level, message = loaded[key][1]
+        getattr(st, level)(message)
+    
+    attractions_data = loaded["attractions"][0]
+    hotels_data = loaded["hotels"][0]
+    restaurants_data = loaded["restaurants"][0]
+    routes_data = loaded["routes"][0]
     
     st.markdown("---")
     
@@ -128,6 +155,12 @@ def main():
         show_preferences()
 
 
+@st.cache_data(ttl=30, show_spinner=False)
+def load_trips_index(index_path, mtime):
+    """Read the saved-trips index; cached until the file changes"""
+    return read_json_file(index_path)
+
+
 def show_my_trips():
     """Display saved trips"""
     trips_dir = "trips"
@@ -136,37 +169,34 @@ def show_my_trips():
         st.info("🔭 No saved trips yet. Create your first road trip!")
         return
     
-    trip_files = [f for f in os.listdir(trips_dir) if f.endswith('.json')]
+    # Render from the summary index rather than opening every trip file
+    index_path = os.path.join(trips_dir, INDEX_FILENAME)
+    try:
+        trips = load_trips_index(index_path, os.path.getmtime(index_path))
+    except Exception:
+        trips = build_trips_index(trips_dir)
     
-    if not trip_files:
+    if not trips:
         st.info("🔭 No saved trips yet. Create your first road trip!")
         return
     
-    st.write(f"Found {len(trip_files)} saved trips:")
+    st.write(f"Found {len(trips)} saved trips:")
     
-    for trip_file in sorted(trip_files, reverse=True):
-        try:
-            with open(os.path.join(trips_dir, trip_file), 'r', encoding='utf-8') as f:
-                trip_data = json.load(f)
+    for trip in sorted(trips, key=lambda t: t['file'], reverse=True):
+        with st.expander(f"🚗 {trip['start_end_text']} - {trip['created_at']}"):
+            col1, col2, col3 = st.columns(3)
             
-            with st.expander(f"🚗 {trip_data.get('start_end_text', 'Unknown')} - {trip_data.get('created_at', 'Unknown date')}"):
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    st.metric("Days", trip_data.get('days', '?'))
-                with col2:
-                    cities = trip_data.get('ordered_cities', [])
-                    st.metric("Cities", len(cities))
-                with col3:
-                    st.metric("Budget", trip_data.get('preferences', {}).get('budget', '?'))
-                
-                st.write("**Route:**", " → ".join(trip_data.get('ordered_cities', [])))
-                
-                if st.button(f"Load Trip", key=trip_file):
-                    st.info("🔄 Loading saved trip... (Feature coming soon)")
-        
-        except Exception as e:
-            st.error(f"Error loading {trip_file}: {str(e)}")
+            with col1:
+                st.metric("Days", trip['days'])
+            with col2:
+                st.metric("Cities", len(trip['ordered_cities']))
+            with col3:
+                st.metric("Budget", trip['budget'])
+            
+            st.write("**Route:**", " → ".join(trip['ordered_cities']))
+            
+            if st.button(f"Load Trip", key=trip['file']):
+                st.info("🔄 Loading saved trip... (Feature coming soon)")
 
 
 def show_preferences():
@@ -189,9 +219,8 @@ def show_preferences():
     
     if os.path.exists(prefs_file):
         try:
-            with open(prefs_file, 'r', encoding='utf-8') as f:
-                saved_prefs = json.load(f)
-                default_prefs.update(saved_prefs)
+            saved_prefs = read_json_file(prefs_file)
+            default_prefs.update(saved_prefs)
         except:
             pass
     
@@ -292,8 +321,9 @@ def show_preferences():
                 "max_same_category_per_day": max_same
             }
             
-            with open(prefs_file, 'w', encoding='utf-8') as f:
-                json.dump(new_prefs, f, ensure_ascii=False, indent=2)
+            # Nothing changed: leave the file alone
+            if new_prefs != default_prefs:
+                write_json_file(prefs_file, new_prefs)
             
             st.success("✅ Preferences saved!")
             st.rerun()
@@ -1,11 +1,30 @@
 """
 AttractionService - Fixed to handle both old and new data formats
 """
+import hashlib
+import json
+import mmap
+import os
+import re
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from typing import List, Dict, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class AttractionService:
+    # Part of the from_json_file cache key: bump it whenever the cleaning in
+    # __init__ or the column dtypes change, so older caches aren't served
+    CACHE_VERSION = 1
+    
     def __init__(self, attractions_data):
         """
         Initialize with attractions data
@@ -48,6 +67,137 @@ class AttractionService:
         # Clean data
         self.df['rating'] = pd.to_numeric(self.df['rating'], errors='coerce').fillna(0.0)
         self.df['visit_duration_hours'] = pd.to_numeric(self.df['visit_duration_hours'], errors='coerce').fillna(2.0)
+        
+        # Few distinct values repeated across every row: store as categoricals
+        # (integer codes + one copy of each string) to cut memory and make
+        # equality filters compare codes
+        for col in ('city', 'category'):
+            if col in self.df.columns:
+                self.df[col] = self.df[col].astype('category')
+        
+        self._build_indexes()
+    
+    def _build_indexes(self):
+        """
+        Precompute lookup indexes (lowercased value -> row positions) so the
+        tag/city/category filters don't scan every row per query
+        """
+        tags = self.df['tags'].reset_index(drop=True).explode().dropna()
+        tags_lower = tags.astype(str).str.lower()
+        positions = tags_lower.index.to_numpy()
+        self._tag_index = {
+            tag: np.unique(positions[idx])
+            for tag, idx in tags_lower.groupby(tags_lower).indices.items()
+        }
+        
+        self._city_index = self._value_index('city')
+        self._category_index = self._value_index('category')
+        
+        # Sorted listings for the dropdowns and the top-rated view
+        self._cities_sorted = sorted(self.df['city'].dropna().unique().tolist()) if 'city' in self.df.columns else []
+        self._categories_sorted = sorted(self.df['category'].dropna().unique().tolist())
+        self._by_rating_desc = self.df.sort_values('rating', ascending=False, kind='stable')
+        
+        # Lowercased search columns, matched with Arrow's substring kernel
+        self._name_lower = self._lower_arrow(self.df['name'])
+        self._has_desc = 'description' in self.df.columns
+        self._desc_lower = self._lower_arrow(self.df['description']) if self._has_desc else None
+    
+    @staticmethod
+    def _lower_arrow(series: pd.Series) -> pa.Array:
+        """Lowercased Arrow string array of a text column (NaN -> null)"""
+        return pc.utf8_lower(pa.array(series, type=pa.string(), from_pandas=True))
+    
+    def _value_index(self, column: str) -> Dict[str, np.ndarray]:
+        """Lowercased column value -> row positions"""
+        if column not in self.df.columns:
+            return {}
+        values = self.df[column]
+        if not isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype('category')
+        
+        # Lowercase the dictionary (each distinct value once) with Arrow's
+        # kernel, then group row positions by category code
+        categories_lower = pc.utf8_lower(
+            pa.array(values.cat.categories.astype(str), type=pa.string())
+        ).to_pylist()
+        codes = values.cat.codes.to_numpy()
+        
+        index = {}
+        for code, positions in pd.Series(codes).groupby(codes).indices.items():
+            if code >= 0:
+                index.setdefault(categories_lower[code], []).append(positions)
+        return {
+            value: parts[0] if len(parts) == 1 else np.sort(np.concatenate(parts))
+            for value, parts in index.items()
+        }
+    
+    @classmethod
+    def from_json_file(cls, filepath: str, cache_dir: str = 'cache') -> 'AttractionService':
+        """
+        Load attractions from a JSON file, reusing a cached copy of the
+        cleaned DataFrame when the file content hasn't changed
+        
+        The cache is named after the source file and keyed on CACHE_VERSION
+        and the MD5 of the JSON bytes; writing a new one removes the file's
+        superseded caches. Parquet is used when Arrow can represent every
+        column; data with mixed-type columns (e.g. opening_hours as list or
+        string) falls back to a pickle.
+        """
+        stem = os.path.splitext(os.path.basename(filepath))[0]
+        
+        # Hash and parse from a memory map: no separate copy of the file bytes
+        with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            cache_name = f"{stem}.v{cls.CACHE_VERSION}.{hashlib.md5(mm).hexdigest()}"
+            cache_base = os.path.join(cache_dir, cache_name)
+            
+            if os.path.exists(cache_base + '.parquet'):
+                return cls._from_cleaned_df(pd.read_parquet(cache_base + '.parquet'))
+            if os.path.exists(cache_base + '.pkl'):
+                return cls._from_cleaned_df(pd.read_pickle(cache_base + '.pkl'))
+            
+            if ORJSON_AVAILABLE:
+                with memoryview(mm) as view:
+                    attractions_data = orjson.loads(view)
+            else:
+                attractions_data = json.loads(mm[:])
+        
+        service = cls(attractions_data)
+        service.df.attrs['metadata'] = service.metadata
+        
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            try:
+                service.df.to_parquet(cache_base + '.parquet', index=False)
+            except Exception:
+                service.df.to_pickle(cache_base + '.pkl')
+            cls._remove_stale_caches(cache_dir, stem, cache_name)
+        except Exception as e:
+            print(f"⚠️ Could not write attractions cache: {e}")
+        
+        return service
+    
+    @staticmethod
+    def _remove_stale_caches(cache_dir: str, stem: str, current_name: str):
+        """Delete caches of the same source file from older content or CACHE_VERSIONs"""
+        # Also matches the unversioned <md5>.parquet/.pkl files of earlier releases
+        stale = re.compile(rf'(?:{re.escape(stem)}\.v\d+\.)?[0-9a-f]{{32}}')
+        for entry in os.scandir(cache_dir):
+            name, ext = os.path.splitext(entry.name)
+            if ext in ('.parquet', '.pkl') and name != current_name and stale.fullmatch(name):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+    
+    @classmethod
+    def _from_cleaned_df(cls, df: pd.DataFrame) -> 'AttractionService':
+        """Build a service around an already-cleaned DataFrame"""
+        service = cls.__new__(cls)
+        service.df = df
+        service.metadata = df.attrs.get('metadata', {})
+        service._build_indexes()
+        return service
     
     def get_all(self) -> pd.DataFrame:
         """Get all attractions"""
@@ -55,11 +205,13 @@ class AttractionService:
     
     def get_by_city(self, city: str) -> pd.DataFrame:
         """Get attractions by city"""
-        return self.df[self.df['city'].str.lower() == city.lower()].copy()
+        positions = self._city_index.get(city.lower(), np.empty(0, dtype=np.int64))
+        return self.df.iloc[positions].copy()
     
     def get_by_category(self, category: str) -> pd.DataFrame:
         """Get attractions by category"""
-        return self.df[self.df['category'].str.lower() == category.lower()].copy()
+        positions = self._category_index.get(category.lower(), np.empty(0, dtype=np.int64))
+        return self.df.iloc[positions].copy()
     
     def get_by_id(self, attraction_id: str) -> Optional[Dict]:
         """Get single attraction by ID"""
@@ -80,31 +232,32 @@ class AttractionService:
     def get_by_tag(self, tag: str) -> pd.DataFrame:
         """Get attractions by tag"""
         tag_lower = tag.lower()
-        mask = self.df['tags'].apply(
-            lambda tags: any(tag_lower in (t or '').lower() for t in (tags or []))
-        )
-        return self.df[mask].copy()
+        # Substring match against the distinct tags, not every row
+        matches = [positions for t, positions in self._tag_index.items() if tag_lower in t]
+        if not matches:
+            return self.df.iloc[[]].copy()
+        return self.df.iloc[np.unique(np.concatenate(matches))].copy()
     
     def get_top_rated(self, n: int = 10) -> pd.DataFrame:
         """Get top N rated attractions"""
-        return self.df.nlargest(n, 'rating').copy()
+        return self._by_rating_desc.head(n).copy()
     
     def get_cities(self) -> List[str]:
         """Get list of all cities"""
-        return sorted(self.df['city'].unique().tolist())
+        return list(self._cities_sorted)
     
     def get_categories(self) -> List[str]:
         """Get list of all categories"""
-        return sorted(self.df['category'].unique().tolist())
+        return list(self._categories_sorted)
     
     def search(self, query: str) -> pd.DataFrame:
         """Search attractions by name or description"""
         query_lower = query.lower()
-        mask = (
-            self.df['name'].str.lower().str.contains(query_lower, na=False) |
-            self.df.get('description', pd.Series([''] * len(self.df))).str.lower().str.contains(query_lower, na=False)
-        )
-        return self.df[mask].copy()
+        mask = pc.match_substring(self._name_lower, query_lower)
+        if self._has_desc:
+            mask = pc.or_kleene(mask, pc.match_substring(self._desc_lower, query_lower))
+        mask = mask.fill_null(False)
+        return self.df.iloc[np.flatnonzero(mask.to_numpy(zero_copy_only=False))].copy()
     
     def get_stats(self) -> Dict:
         """Get statistics about attractions"""
@@ -3,132 +3,77 @@ Document Helpers for Andalusia Travel App
 Utility functions for document generation
 """
 
-import unicodedata
+import functools
+import re
 
+# Re-exported: callers import these helpers from here
+from docx_links import add_hyperlink
+from text_norm import normalize_city_name
 
-def normalize_city_name(city_name):
-    """Normalize city name for matching"""
-    if not city_name:
-        return ""
-    import unicodedata
-    city_name = str(city_name)
-    nfd = unicodedata.normalize('NFD', city_name)
-    without_accents = ''.join(char for char in nfd if unicodedata.category(char) != 'Mn')
-    return without_accents.lower().strip()
+# City descriptions and tips by normalized city name, built once at import
+_CITY_PREFIXES = {
+    'malaga': 'Coastal gem with museums, beaches, and vibrant culture',
+    'granada': 'Home to the magnificent Alhambra palace',
+    'cordoba': 'Historic city famous for the stunning Mezquita',
+    'seville': 'Andalusia\'s capital, heart of flamenco and tapas',
+    'cadiz': 'Ancient port city with beautiful beaches',
+    'ronda': 'Dramatic clifftop town with iconic bridge',
+    'jerez': 'Home of sherry wine and Andalusian horses',
+    'tarifa': 'Southernmost point of Europe, windsurfing paradise'
+}
 
+_CITY_TIPS = {
+    'granada': [
+        'Book Alhambra tickets 2-3 months in advance!',
+        'Free tapas with every drink - bar hop in Albaicín',
+        'Visit Mirador San Nicolás at sunset for stunning views'
+    ],
+    'seville': [
+        'Alcázar is less crowded early morning',
+        'Best tapas in Triana neighborhood',
+        'Flamenco shows in Barrio Santa Cruz'
+    ],
+    'cordoba': [
+        'Visit Mezquita early (8:30am) to avoid crowds',
+        'Wander the flower-filled patios in spring',
+        'Cross the Roman Bridge at sunset'
+    ]
+}
 
-def add_hyperlink(paragraph, url, text):
-    """
-    Add a working hyperlink to a Word document paragraph
-    
-    Args:
-        paragraph: The paragraph to add the hyperlink to
-        url: The URL string
-        text: The display text
-    
-    Returns:
-        The hyperlink element
-    """
-    from docx.oxml.shared import OxmlElement
-    from docx.oxml.ns import qn
-    from docx.shared import RGBColor, Pt
-    
-    # Get the paragraph's parent part
-    part = paragraph.part
-    
-    # Create a relationship to the URL
-    r_id = part.relate_to(
-        url, 
-        'http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink', 
-        is_external=True
-    )
-    
-    # Create the w:hyperlink element
-    hyperlink = OxmlElement('w:hyperlink')
-    hyperlink.set(qn('r:id'), r_id)
-    
-    # Create a new run element
-    new_run = OxmlElement('w:r')
-    
-    # Create run properties
-    rPr = OxmlElement('w:rPr')
-    
-    # Add color
-    color = OxmlElement('w:color')
-    color.set(qn('w:val'), '2980B9')  # Blue color
-    rPr.append(color)
-    
-    # Add underline
-    u = OxmlElement('w:u')
-    u.set(qn('w:val'), 'single')
-    rPr.append(u)
-    
-    new_run.append(rPr)
-    
-    # Add the text
-    text_elem = OxmlElement('w:t')
-    text_elem.text = text
-    new_run.append(text_elem)
-    
-    hyperlink.append(new_run)
-    
-    # Add to paragraph
-    paragraph._p.append(hyperlink)
-    
-    return hyperlink
+# POI tips, checked in order against the lowercased POI name
+_POI_TIPS = {
+    'alhambra': 'Book tickets online months in advance - they sell out!',
+    'mezquita': 'Visit during morning prayer time (free entry 8:30-9:30am)',
+    'alcazar': 'Book early morning slot to avoid crowds',
+    'cathedral': 'Climb the tower for panoramic views'
+}
+_POI_TIP_TEXTS = tuple(_POI_TIPS.values())
+
+# One lookahead per key, tried in _POI_TIPS order: the first key found
+# anywhere in the name wins, as in a key-by-key substring scan, but the
+# whole check runs as a single compiled match. The matching group number
+# picks the tip
+_POI_TIP_RE = re.compile(
+    r'\A(?:' + '|'.join('(?=.*?(' + re.escape(key) + '))' for key in _POI_TIPS) + ')',
+    re.DOTALL
+)
 
 
 def get_city_prefix(city_norm):
     """Get city description"""
-    descriptions = {
-        'malaga': 'Coastal gem with museums, beaches, and vibrant culture',
-        'granada': 'Home to the magnificent Alhambra palace',
-        'cordoba': 'Historic city famous for the stunning Mezquita',
-        'seville': 'Andalusia\'s capital, heart of flamenco and tapas',
-        'cadiz': 'Ancient port city with beautiful beaches',
-        'ronda': 'Dramatic clifftop town with iconic bridge',
-        'jerez': 'Home of sherry wine and Andalusian horses',
-        'tarifa': 'Southernmost point of Europe, windsurfing paradise'
-    }
-    return descriptions.get(city_norm, '')
+    return _CITY_PREFIXES.get(city_norm, '')
 
 
 def get_city_tips(city_norm):
     """Get city-specific tips"""
-    tips = {
-        'granada': [
-            'Book Alhambra tickets 2-3 months in advance!',
-            'Free tapas with every drink - bar hop in Albaicín',
-            'Visit Mirador San Nicolás at sunset for stunning views'
-        ],
-        'seville': [
-            'Alcázar is less crowded early morning',
-            'Best tapas in Triana neighborhood',
-            'Flamenco shows in Barrio Santa Cruz'
-        ],
-        'cordoba': [
-            'Visit Mezquita early (8:30am) to avoid crowds',
-            'Wander the flower-filled patios in spring',
-            'Cross the Roman Bridge at sunset'
-        ]
-    }
-    return tips.get(city_norm, [])
+    return list(_CITY_TIPS.get(city_norm, ()))
 
 
+@functools.lru_cache(maxsize=512)
 def get_poi_tip(poi_name):
-    """Get POI-specific tip"""
-    tips = {
-        'alhambra': 'Book tickets online months in advance - they sell out!',
-        'mezquita': 'Visit during morning prayer time (free entry 8:30-9:30am)',
-        'alcazar': 'Book early morning slot to avoid crowds',
-        'cathedral': 'Climb the tower for panoramic views'
-    }
-    
-    name_lower = poi_name.lower()
-    for key, tip in tips.items():
-        if key in name_lower:
-            return tip
-    return None
+    """Get POI-specific tip (cached: the same POIs recur across days)"""
+    match = _POI_TIP_RE.match(poi_name.lower())
+    return _POI_TIP_TEXTS[match.lastindex - 1] if match else None
 
 
 def get_poi_description_fallback(name, category):
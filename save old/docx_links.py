@@ -0,0 +1,78 @@
+"""
+Hyperlink helpers shared by the Word document builders
+"""
+
+# python-docx is imported inside the functions, so importing this module
+# doesn't pull it in
+import copy
+import functools
+
+
+# Relationship type and text color (hex RGB, blue) for hyperlinks
+_HYPERLINK_RELTYPE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink'
+_LINK_COLOR = '2980B9'
+
+
+@functools.lru_cache(maxsize=None)
+def _link_rpr():
+    """Run properties (blue, underlined) for hyperlink text, built once; callers deepcopy it"""
+    from docx.oxml.shared import OxmlElement
+    from docx.oxml.ns import qn
+    
+    rPr = OxmlElement('w:rPr')
+    
+    # Add color
+    color = OxmlElement('w:color')
+    color.set(qn('w:val'), _LINK_COLOR)
+    rPr.append(color)
+    
+    # Add underline
+    u = OxmlElement('w:u')
+    u.set(qn('w:val'), 'single')
+    rPr.append(u)
+    
+    return rPr
+
+
+def add_hyperlink(paragraph, url, text):
+    """
+    Add a working hyperlink to a Word document paragraph
+    
+    Args:
+        paragraph: The paragraph to add the hyperlink to
+        url: The URL string
+        text: The display text
+    
+    Returns:
+        The hyperlink element
+    """
+    from docx.oxml.shared import OxmlElement
+    from docx.oxml.ns import qn
+    
+    # Get the paragraph's parent part
+    part = paragraph.part
+    
+    # Create a relationship to the URL
+    r_id = part.relate_to(url, _HYPERLINK_RELTYPE, is_external=True)
+    
+    # Create the w:hyperlink element
+    hyperlink = OxmlElement('w:hyperlink')
+    hyperlink.set(qn('r:id'), r_id)
+    
+    # Create a new run element
+    new_run = OxmlElement('w:r')
+    
+    # Blue, underlined run properties
+    new_run.append(copy.deepcopy(_link_rpr()))
+    
+    # Add the text
+    text_elem = OxmlElement('w:t')
+    text_elem.text = text
+    new_run.append(text_elem)
+    
+    hyperlink.append(new_run)
+    
+    # Add to paragraph
+    paragraph._p.append(hyperlink)
+    
+    return hyperlink
@@ -4,10 +4,31 @@ Extract hotels from OpenStreetMap for Andalusian cities
 """
 
 import requests
+import urllib3
 import json
 import time
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from typing import List, Optional
+
+# orjson parses the Overpass responses and writes the output faster; optional
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ijson parses the Overpass elements straight off the socket; optional
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+    JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    IJSON_AVAILABLE = False
+    JSON_ERRORS = (json.JSONDecodeError,)
 
 # ============================================================================
 # CONFIGURATION
@@ -48,11 +69,176 @@ CITIES = [
 
 HOTELS_PER_CITY = 15  # Number of hotels to fetch per city
 DELAY_BETWEEN_REQUESTS = 3  # Seconds (be nice to OSM servers!)
+PARALLEL_REQUESTS = 2  # Overpass gives each client ~2 query slots
+
+OVERPASS_URL = "http://overpass-api.de/api/interpreter"
+
+# Overpass QL query to find hotels in a city: % (city_name, limit)
+OVERPASS_QUERY = """
+    [out:json][timeout:25];
+    area["name"="%s"]["admin_level"~"[68]"]->.searchArea;
+    (
+      node["tourism"="hotel"](area.searchArea);
+      way["tourism"="hotel"](area.searchArea);
+      relation["tourism"="hotel"](area.searchArea);
+    );
+    out center %s;
+    """
+
+# OSM tag -> (value that means "has it", amenity label), in output order
+AMENITY_TAGS = {
+    "internet_access": ("wlan", "WiFi"),
+    "parking": ("yes", "Parking"),
+    "wheelchair": ("yes", "Wheelchair accessible"),
+    "air_conditioning": ("yes", "Air conditioning"),
+    "swimming_pool": ("yes", "Swimming pool"),
+    "restaurant": ("yes", "Restaurant"),
+}
+
+# ============================================================================
+# HOTEL RECORD
+# ============================================================================
+
+@dataclass(slots=True)
+class Hotel:
+    """One OSM hotel; flat and slotted while extracting, nested dict for the output file"""
+    id: str
+    name: str
+    city: str
+    lat: float
+    lon: float
+    star_rating: Optional[int]
+    website: Optional[str]
+    phone: Optional[str]
+    email: Optional[str]
+    opening_hours: Optional[str]
+    amenities: List[str]
+    osm_id: int
+    osm_type: str
+    
+    def to_dict(self):
+        """Hotel in the andalusia_hotels_osm.json schema"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "city": self.city,
+            "category": "Hotel",
+            "coordinates": {
+                "lat": self.lat,
+                "lon": self.lon
+            },
+            "star_rating": self.star_rating,
+            "avg_price_per_night_couple": None,  # OSM doesn't have prices
+            "guest_rating": None,
+            "website": self.website,
+            "phone": self.phone,
+            "email": self.email,
+            "opening_hours": self.opening_hours,
+            "amenities": self.amenities,
+            "source": "OpenStreetMap",
+            "osm_id": self.osm_id,
+            "osm_type": self.osm_type
+        }
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+def _iter_elements(response):
+    """Elements of an Overpass response, parsed as they arrive when ijson is installed"""
+    if IJSON_AVAILABLE:
+        response.raw.decode_content = True  # let urllib3 undo gzip
+        return ijson.items(response.raw, "elements.item", use_float=True)
+    
+    # orjson reads the raw bytes, skipping the decode to str
+    data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+    return data.get("elements", [])
+
+
+def _hotel_json(hotel):
+    """One hotel as UTF-8 JSON, indented to sit inside the output array"""
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(hotel.to_dict(), option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(hotel.to_dict(), indent=2, ensure_ascii=False).encode("utf-8")
+    return b"  " + data.replace(b"\n", b"\n  ")
+
+
+# One session per worker thread (requests.Session isn't documented as
+# thread-safe), so each worker keeps its connection to Overpass alive
+# instead of re-opening it per request
+_THREAD_LOCAL = threading.local()
+
+
+def _session():
+    """This thread's requests session, created on first use"""
+    session = getattr(_THREAD_LOCAL, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update({'User-Agent': 'Andalusia-Travel-App/1.0'})
+        _THREAD_LOCAL.session = session
+    return session
+
+
+def _hotel_from_element(element, city_name):
+    """
+    Build the Hotel record for one Overpass element
+    
+    Straight-line on purpose: every element and tag field is read exactly
+    once into a local. Returns None for elements without coordinates or
+    without a name tag (an unnamed hotel is useless in the itinerary).
+    """
+    # Get coordinates
+    osm_type = element.get("type")
+    if osm_type == "node":
+        lat = element.get("lat")
+        lon = element.get("lon")
+    else:  # way or relation
+        center = element.get("center", {})
+        lat = center.get("lat")
+        lon = center.get("lon")
+    
+    if not lat or not lon:
+        return None
+    
+    # Skip untagged/unnamed elements before touching any other tag
+    tags = element.get("tags")
+    if not tags:
+        return None
+    get = tags.get
+    name = get("name")
+    if not name:
+        return None
+    
+    # Parse star rating
+    stars = get("stars")
+    if stars:
+        try:
+            stars = int(stars)
+        except:
+            stars = None
+    
+    # Extract amenities
+    amenities = [label for tag, (value, label) in AMENITY_TAGS.items() if get(tag) == value]
+    
+    osm_id = element.get("id")
+    return Hotel(
+        id=f"OSM_{osm_type}_{osm_id}",
+        name=name,
+        city=city_name,
+        lat=float(lat),
+        lon=float(lon),
+        star_rating=stars,
+        website=get("website") or get("contact:website"),
+        phone=get("phone") or get("contact:phone"),
+        email=get("email") or get("contact:email"),
+        opening_hours=get("opening_hours"),
+        amenities=amenities,
+        osm_id=osm_id,
+        osm_type=osm_type,
+    )
+
+
 def get_osm_hotels(city_name, country="España", limit=15):
     """
     Fetch hotels from OpenStreetMap using Overpass API
@@ -63,119 +249,49 @@ def get_osm_hotels(city_name, country="España", limit=15):
         limit: Maximum number of hotels to return
     
     Returns:
-        List of hotel dictionaries
+        List of Hotel records
     """
     
-    overpass_url = "http://overpass-api.de/api/interpreter"
-    
-    # Overpass QL query to find hotels in a city
-    query = f"""
-    [out:json][timeout:25];
-    area["name"="{city_name}"]["admin_level"~"[68]"]->.searchArea;
-    (
-      node["tourism"="hotel"](area.searchArea);
-      way["tourism"="hotel"](area.searchArea);
-      relation["tourism"="hotel"](area.searchArea);
-    );
-    out center {limit};
-    """
+    query = OVERPASS_QUERY % (city_name, limit)
     
     try:
         print(f"  Querying OpenStreetMap for {city_name}...")
-        response = requests.post(
-            overpass_url, 
-            data={"data": query}, 
-            timeout=30,
-            headers={'User-Agent': 'Andalusia-Travel-App/1.0'}
-        )
-        
-        if response.status_code != 200:
-            print(f"  ❌ HTTP {response.status_code} for {city_name}")
-            return []
+        response = _session().post(OVERPASS_URL, data={"data": query}, timeout=30, stream=IJSON_AVAILABLE)
         
-        data = response.json()
-        
-        hotels = []
-        for element in data.get("elements", []):
-            # Get coordinates
-            if element.get("type") == "node":
-                lat = element.get("lat")
-                lon = element.get("lon")
-            else:  # way or relation
-                center = element.get("center", {})
-                lat = center.get("lat")
-                lon = center.get("lon")
-            
-            if not lat or not lon:
-                continue
-            
-            tags = element.get("tags", {})
-            
-            # Parse star rating
-            stars = tags.get("stars")
-            if stars:
-                try:
-                    stars = int(stars)
-                except:
-                    stars = None
+        with response:
+            if response.status_code != 200:
+                print(f"  ❌ HTTP {response.status_code} for {city_name}")
+                return []
             
-            # Create hotel object
-            hotel = {
-                "id": f"OSM_{element.get('type')}_{element.get('id')}",
-                "name": tags.get("name", f"Hotel in {city_name}"),
-                "city": city_name,
-                "category": "Hotel",
-                "coordinates": {
-                    "lat": float(lat),
-                    "lon": float(lon)
-                },
-                "star_rating": stars,
-                "avg_price_per_night_couple": None,  # OSM doesn't have prices
-                "guest_rating": None,
-                "website": tags.get("website") or tags.get("contact:website"),
-                "phone": tags.get("phone") or tags.get("contact:phone"),
-                "email": tags.get("email") or tags.get("contact:email"),
-                "opening_hours": tags.get("opening_hours"),
-                "amenities": [],
-                "source": "OpenStreetMap",
-                "osm_id": element.get("id"),
-                "osm_type": element.get("type")
-            }
+            hotels = []
+            for element in _iter_elements(response):
+                hotel = _hotel_from_element(element, city_name)
+                if hotel is not None:
+                    hotels.append(hotel)
             
-            # Extract amenities
-            amenities = []
-            if tags.get("internet_access") == "wlan":
-                amenities.append("WiFi")
-            if tags.get("parking") == "yes":
-                amenities.append("Parking")
-            if tags.get("wheelchair") == "yes":
-                amenities.append("Wheelchair accessible")
-            if tags.get("air_conditioning") == "yes":
-                amenities.append("Air conditioning")
-            if tags.get("swimming_pool") == "yes":
-                amenities.append("Swimming pool")
-            if tags.get("restaurant") == "yes":
-                amenities.append("Restaurant")
-            
-            hotel["amenities"] = amenities
-            
-            hotels.append(hotel)
-        
-        return hotels
+            return hotels
         
-    except requests.exceptions.Timeout:
+    # While ijson streams from response.raw, urllib3 errors come through
+    # unwrapped, so they are caught next to their requests counterparts
+    except (requests.exceptions.Timeout, urllib3.exceptions.TimeoutError):
         print(f"  ⏱️ Timeout for {city_name}")
         return []
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
         print(f"  ❌ Request error for {city_name}: {e}")
         return []
-    except json.JSONDecodeError as e:
+    except JSON_ERRORS as e:
         print(f"  ❌ JSON decode error for {city_name}: {e}")
         return []
     except Exception as e:
         print(f"  ❌ Unexpected error for {city_name}: {e}")
         return []
 
+def fetch_city_hotels(city_info):
+    """Fetch one city's hotels, then pause so each worker stays polite to OSM"""
+    hotels = get_osm_hotels(city_info["name"], limit=HOTELS_PER_CITY)
+    time.sleep(DELAY_BETWEEN_REQUESTS)
+    return hotels
+
 # ============================================================================
 # MAIN EXTRACTION
 # ============================================================================
@@ -189,8 +305,7 @@ def main():
     # Create data directory if it doesn't exist
     os.makedirs("data", exist_ok=True)
     
-    # Start with empty list
-    existing_hotels = []
+    # IDs seen so far, to skip hotels returned for more than one city
     existing_ids = set()
     
     # Fetch hotels from OSM
@@ -198,30 +313,44 @@ def main():
     print(f"FETCHING HOTELS FROM {len(CITIES)} CITIES")
     print("=" * 70)
     
-    all_new_hotels = []
+    # Each city's new hotels are written out as soon as it completes, so only
+    # one city's results are held in memory. The array goes to a temp file
+    # that replaces OUTPUT_FILE once complete, so a failed run never leaves
+    # a truncated file behind
+    temp_file = OUTPUT_FILE + ".tmp"
+    saved = 0
+    city_counts = {}
     
-    for i, city_info in enumerate(CITIES, 1):
-        city_name = city_info["name"]
-        print(f"\n[{i}/{len(CITIES)}] {city_name}")
+    # A few cities in flight at once; each worker still waits
+    # DELAY_BETWEEN_REQUESTS after its request. map() yields in CITIES order,
+    # so duplicates are resolved the same way as a serial run
+    # Results are consumed on this thread only, so writes need no lock
+    with ThreadPoolExecutor(max_workers=PARALLEL_REQUESTS) as executor, \
+         open(temp_file, "wb", buffering=1 << 16) as f:
+        results = executor.map(fetch_city_hotels, CITIES)
+        f.write(b"[")
         
-        hotels = get_osm_hotels(city_name, limit=HOTELS_PER_CITY)
-        
-        if hotels:
-            # Filter out duplicates
-            new_hotels = [h for h in hotels if h.get("id") not in existing_ids]
-            all_new_hotels.extend(new_hotels)
-            
-            print(f"  ✅ Found {len(hotels)} hotels ({len(new_hotels)} new)")
+        for i, (city_info, hotels) in enumerate(zip(CITIES, results), 1):
+            city_name = city_info["name"]
+            print(f"\n[{i}/{len(CITIES)}] {city_name}")
             
-            # Add new IDs to existing set
-            existing_ids.update(h.get("id") for h in new_hotels)
-        else:
-            print(f"  ⚠️ No hotels found")
+            if hotels:
+                # Filter out duplicates, recording each new ID as it's kept
+                new = 0
+                for hotel in hotels:
+                    if hotel.id not in existing_ids:
+                        existing_ids.add(hotel.id)
+                        f.write((b",\n" if saved else b"\n") + _hotel_json(hotel))
+                        saved += 1
+                        new += 1
+                
+                if new:
+                    city_counts[city_name] = new
+                print(f"  ✅ Found {len(hotels)} hotels ({new} new)")
+            else:
+                print(f"  ⚠️ No hotels found")
         
-        # Rate limiting - be nice to OSM servers
-        if i < len(CITIES):
-            print(f"  ⏳ Waiting {DELAY_BETWEEN_REQUESTS}s...")
-            time.sleep(DELAY_BETWEEN_REQUESTS)
+        f.write(b"\n]" if saved else b"]")
     
     # ========================================================================
     # SAVE RESULTS
@@ -231,13 +360,9 @@ def main():
     print("SAVING RESULTS")
     print("=" * 70)
     
-    # Save extracted hotels
-    all_hotels = all_new_hotels
+    os.replace(temp_file, OUTPUT_FILE)
     
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(all_hotels, f, indent=2, ensure_ascii=False)
-    
-    print(f"\n✅ Saved {len(all_hotels)} hotels to {OUTPUT_FILE}")
+    print(f"\n✅ Saved {saved} hotels to {OUTPUT_FILE}")
     
     # ========================================================================
     # STATISTICS
@@ -247,11 +372,6 @@ def main():
     print("STATISTICS BY CITY")
     print("=" * 70)
     
-    city_counts = {}
-    for hotel in all_hotels:
-        city = hotel.get("city", "Unknown")
-        city_counts[city] = city_counts.get(city, 0) + 1
-    
     for city, count in sorted(city_counts.items(), key=lambda x: x[1], reverse=True):
         print(f"{city:30} {count:3} hotels")
     
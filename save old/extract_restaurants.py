@@ -1,8 +1,21 @@
 import json
-
-# Load your attractions
-with open("data/andalusia_attractions_enriched.json", "r", encoding="utf-8") as f:
-    all_data = json.load(f)
+import operator
+import re
+from collections import Counter, defaultdict
+
+# orjson reads and writes the JSON files several times faster; optional
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ijson streams the input one item at a time instead of loading it whole; optional
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 # Separate into attractions and restaurants
 tourist_attractions = []
@@ -18,19 +31,20 @@ ATTRACTION_CATEGORIES = {
     'Viewpoint', 'Palace', 'Cave', 'Market'
 }
 
+# Tag keywords that name a cuisine, matched case-insensitively in one pass
+CUISINE_KEYWORDS = ('spanish', 'tapas', 'mediterranean', 'andalusian',
+                    'seafood', 'traditional', 'regional')
+CUISINE_RE = re.compile('|'.join(CUISINE_KEYWORDS), re.IGNORECASE)
+
 def extract_cuisine(item):
     """Extract cuisine from tags"""
     tags = item.get('tags', [])
     
     # If tags is a list, look for cuisine-related keywords
     if isinstance(tags, list):
-        cuisine_keywords = ['spanish', 'tapas', 'mediterranean', 'andalusian', 
-                          'seafood', 'traditional', 'regional']
         for tag in tags:
-            if isinstance(tag, str):
-                tag_lower = tag.lower()
-                if any(keyword in tag_lower for keyword in cuisine_keywords):
-                    return tag.title()
+            if isinstance(tag, str) and CUISINE_RE.search(tag):
+                return tag.title()
         return 'Spanish'
     
     # If tags is a dict
@@ -56,40 +70,63 @@ def estimate_price_range(item):
     else:
         return '$$'  # Default mid-range
 
-for item in all_data:
-    category = item.get('category', '')
-    name = item.get('name')
-    
-    # Skip items without names
-    if not name or name == 'None':
-        continue
-    
-    if category in ATTRACTION_CATEGORIES:
-        tourist_attractions.append(item)
+def save_json(path, data):
+    """Write data as indented UTF-8 JSON"""
+    if ORJSON_AVAILABLE:
+        # One call produces the whole UTF-8 document
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
     
-    elif category == 'Restaurant':
-        # Convert to restaurant format
-        restaurant = {
-            'name': name,
-            'city': item.get('city'),
-            'cuisine': extract_cuisine(item),
-            'rating': item.get('rating'),
-            'price_range': estimate_price_range(item),
-            'description': item.get('description', f"Local restaurant in {item.get('city', 'Andalusia')}"),
-            'address': item.get('address', ''),
-            'coordinates': item.get('coordinates'),
-            'tags': item.get('tags', [])
-        }
-        restaurants.append(restaurant)
-    
-    elif category == 'Bar/Nightlife':
-        bars.append(item)
-    
-    elif category == 'Hotel':
-        hotels_venues.append(item)
+    # json.dump makes many tiny writes; a 1 MiB buffer batches them
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+# Load your attractions, bucketing each item as it is read
+total = 0
+with open("data/andalusia_attractions_enriched.json", "rb") as f:
+    if IJSON_AVAILABLE:
+        items = ijson.items(f, 'item', use_float=True)
+    elif ORJSON_AVAILABLE:
+        items = orjson.loads(f.read())
+    else:
+        items = json.load(f)
     
-    elif category == 'Shopping':
-        shops.append(item)
+    for item in items:
+        total += 1
+        category = item.get('category', '')
+        name = item.get('name')
+        
+        # Skip items without names
+        if not name or name == 'None':
+            continue
+        
+        if category in ATTRACTION_CATEGORIES:
+            tourist_attractions.append(item)
+        
+        elif category == 'Restaurant':
+            # Convert to restaurant format
+            restaurant = {
+                'name': name,
+                'city': item.get('city'),
+                'cuisine': extract_cuisine(item),
+                'rating': item.get('rating'),
+                'price_range': estimate_price_range(item),
+                'description': item.get('description', f"Local restaurant in {item.get('city', 'Andalusia')}"),
+                'address': item.get('address', ''),
+                'coordinates': item.get('coordinates'),
+                'tags': item.get('tags', [])
+            }
+            restaurants.append(restaurant)
+        
+        elif category == 'Bar/Nightlife':
+            bars.append(item)
+        
+        elif category == 'Hotel':
+            hotels_venues.append(item)
+        
+        elif category == 'Shopping':
+            shops.append(item)
 
 print(f"\n{'='*60}")
 print(f"{'DATA SEPARATION RESULTS':^60}")
@@ -100,22 +137,19 @@ print(f"🍺 Bars/Nightlife:      {len(bars):>6,}")
 print(f"🏨 Hotels (venues):     {len(hotels_venues):>6,}")
 print(f"🛍️  Shopping:            {len(shops):>6,}")
 print(f"{'-'*60}")
-print(f"📊 Total original:      {len(all_data):>6,}")
+print(f"📊 Total original:      {total:>6,}")
 print(f"{'='*60}\n")
 
 # Save tourist attractions (cleaned)
-with open("data/andalusia_attractions_filtered.json", "w", encoding="utf-8") as f:
-    json.dump(tourist_attractions, f, ensure_ascii=False, indent=2)
+save_json("data/andalusia_attractions_filtered.json", tourist_attractions)
 print(f"✅ Saved {len(tourist_attractions):,} attractions to: data/andalusia_attractions_filtered.json")
 
 # Save restaurants (for lunch/dinner recommendations)
-with open("data/restaurants.json", "w", encoding="utf-8") as f:
-    json.dump(restaurants, f, ensure_ascii=False, indent=2)
+save_json("data/restaurants.json", restaurants)
 print(f"✅ Saved {len(restaurants):,} restaurants to: data/restaurants.json")
 
 # Optional: Save bars separately (could be used for nightlife recommendations)
-with open("data/bars.json", "w", encoding="utf-8") as f:
-    json.dump(bars, f, ensure_ascii=False, indent=2)
+save_json("data/bars.json", bars)
 print(f"✅ Saved {len(bars):,} bars to: data/bars.json")
 
 # Show restaurants per city
@@ -123,27 +157,27 @@ print(f"\n{'='*60}")
 print(f"{'RESTAURANTS PER CITY':^60}")
 print(f"{'='*60}")
 
-city_counts = {}
-city_ratings = {}
+city_counts = Counter()
+rating_sums = defaultdict(float)
+rating_counts = Counter()
 
 for r in restaurants:
     city = r.get('city', 'Unknown')
     rating = r.get('rating')
     
-    city_counts[city] = city_counts.get(city, 0) + 1
+    city_counts[city] += 1
     
     if rating:
-        if city not in city_ratings:
-            city_ratings[city] = []
-        city_ratings[city].append(rating)
+        rating_sums[city] += rating
+        rating_counts[city] += 1
 
 # Show top 15 cities with restaurants
-sorted_cities = sorted(city_counts.items(), key=lambda x: x[1], reverse=True)[:15]
+sorted_cities = sorted(city_counts.items(), key=operator.itemgetter(1), reverse=True)[:15]
 
 for city, count in sorted_cities:
     avg_rating = ''
-    if city in city_ratings and city_ratings[city]:
-        avg = sum(city_ratings[city]) / len(city_ratings[city])
+    if rating_counts[city]:
+        avg = rating_sums[city] / rating_counts[city]
         avg_rating = f"(avg ⭐ {avg:.1f})"
     
     print(f"  {city:<25} {count:>4,} restaurants {avg_rating}")
@@ -1,7 +1,10 @@
 """
 FilterService - Advanced filtering and search capabilities
 """
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from typing import List, Dict, Optional
 
 
@@ -45,12 +48,7 @@ class FilterService:
         
         # Filter by tags
         if 'tags' in criteria and criteria['tags']:
-            mask = df['tags'].apply(
-                lambda tags: any(
-                    any(tag.lower() in t.lower() for tag in criteria['tags'])
-                    for t in tags
-                )
-            )
+            mask = self._tags_contain(df['tags'], [tag.lower() for tag in criteria['tags']])
             df = df[mask]
         
         # Filter by free entrance
@@ -68,12 +66,31 @@ class FilterService:
             mask = (
                 df['name'].str.lower().str.contains(query, na=False) |
                 df['description'].str.lower().str.contains(query, na=False) |
-                df['tags'].apply(lambda tags: any(query in t.lower() for t in tags))
+                self._tags_contain(df['tags'], [query])
             )
             df = df[mask]
         
         return df
     
+    @staticmethod
+    def _tags_contain(tags: pd.Series, needles: List[str]) -> np.ndarray:
+        """
+        Row mask: True where any tag contains any of the (lowercase) needles.
+        Matches over the flattened tag values with Arrow kernels instead of
+        a Python lambda per row.
+        """
+        tags_arr = pa.array(tags, type=pa.list_(pa.string()), from_pandas=True)
+        flat = pc.utf8_lower(pc.list_flatten(tags_arr))
+        
+        hit = pc.match_substring(flat, needles[0])
+        for needle in needles[1:]:
+            hit = pc.or_kleene(hit, pc.match_substring(flat, needle))
+        hit = hit.fill_null(False).to_numpy(zero_copy_only=False)
+        
+        mask = np.zeros(len(tags_arr), dtype=bool)
+        mask[pc.list_parent_indices(tags_arr).to_numpy()[hit]] = True
+        return mask
+    
     def sort(self, df: pd.DataFrame, sort_by: str = 'rating', 
              order: str = 'desc') -> pd.DataFrame:
         """Sort attractions by various criteria"""
@@ -98,11 +115,11 @@ class FilterService:
     
     def group_by_city(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
         """Group attractions by city"""
-        return {city: group for city, group in df.groupby('city')}
+        return {city: group for city, group in df.groupby('city', observed=True)}
     
     def group_by_category(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
         """Group attractions by category"""
-        return {cat: group for cat, group in df.groupby('category')}
+        return {cat: group for cat, group in df.groupby('category', observed=True)}
     
     def get_recommendations(self, preferences: Dict) -> pd.DataFrame:
         """Get attractions matching user preferences"""
@@ -4,9 +4,12 @@ Optimized for travelers with rental cars - focuses on base cities and day trips
 """
 
 import streamlit as st
+import functools
 import math
+import operator
 import unicodedata
-from collections import Counter
+import numpy as np
+from collections import Counter, defaultdict
 from urllib.parse import quote_plus
 
 
@@ -15,12 +18,28 @@ def normalize_city_name(city_name):
     if not city_name:
         return ""
     
-    city_name = str(city_name)
+    return _normalize_city_str(str(city_name))
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_city_str(city_name):
+    # The same few dozen city names are normalized for every POI and hotel
     nfd = unicodedata.normalize('NFD', city_name)
     without_accents = ''.join(char for char in nfd if unicodedata.category(char) != 'Mn')
     return without_accents.lower().strip()
 
 
+CITY_ALIASES = {
+    'seville': {'seville', 'sevilla'},
+    'cordoba': {'cordoba', 'córdoba', 'cordova'},
+    'malaga': {'malaga', 'málaga'},
+    'cadiz': {'cadiz', 'cádiz'},
+    'jerez': {'jerez', 'jerez de la frontera'},
+    'granada': {'granada'},
+    'almeria': {'almeria', 'almería'},
+}
+
+
 def cities_match(city1, city2):
     """Check if two city names match (ignoring accents and case)"""
     if not city1 or not city2:
@@ -32,17 +51,7 @@ def cities_match(city1, city2):
     if norm1 == norm2:
         return True
     
-    city_aliases = {
-        'seville': {'seville', 'sevilla'},
-        'cordoba': {'cordoba', 'córdoba', 'cordova'},
-        'malaga': {'malaga', 'málaga'},
-        'cadiz': {'cadiz', 'cádiz'},
-        'jerez': {'jerez', 'jerez de la frontera'},
-        'granada': {'granada'},
-        'almeria': {'almeria', 'almería'},
-    }
-    
-    for canonical, aliases in city_aliases.items():
+    for canonical, aliases in CITY_ALIASES.items():
         if norm1 in aliases and norm2 in aliases:
             return True
     
@@ -103,6 +112,39 @@ def haversine_km(a, b, road_factor=1.3):
         return float("inf")
 
 
+def haversine_km_vec(base, lats, lons, road_factor=1.3, cos_lats=None):
+    """
+    Driving distances from one coordinate to many, as a NumPy array
+    
+    Same formula as haversine_km, evaluated for all points at once.
+    NaN points, or an invalid base, give inf. cos_lats is cos(radians(lats)),
+    if already computed.
+    """
+    if not base or not isinstance(base, tuple) or len(base) != 2:
+        return np.full(len(lats), np.inf)
+    
+    try:
+        lat1, lon1 = float(base[0]), float(base[1])
+    except (ValueError, TypeError):
+        return np.full(len(lats), np.inf)
+    
+    if not (-90 <= lat1 <= 90 and -180 <= lon1 <= 180):
+        return np.full(len(lats), np.inf)
+    
+    R = 6371.0
+    dlat = np.radians(lats - lat1)
+    dlon = np.radians(lons - lon1)
+    sa = np.sin(dlat / 2) ** 2
+    if cos_lats is None:
+        cos_lats = np.cos(np.radians(lats))
+    sb = math.cos(math.radians(lat1)) * cos_lats * np.sin(dlon / 2) ** 2
+    straight_line = 2 * R * np.arctan2(np.sqrt(sa + sb), np.sqrt(1 - (sa + sb)))
+    
+    distances = straight_line * road_factor
+    distances[np.isnan(distances)] = np.inf
+    return distances
+
+
 def calculate_driving_time(distance_km):
     """
     Calculate driving time with realistic speed estimates
@@ -216,6 +258,24 @@ def get_poi_coordinates(poi):
     return None
 
 
+def poi_coordinate_arrays(pois):
+    """
+    Latitude, longitude and cos(latitude) arrays for a list of POIs
+    
+    NaN where there are no valid coordinates. The cosines are the part of
+    the haversine that doesn't depend on the base, so they're computed once.
+    """
+    lats = np.full(len(pois), np.nan)
+    lons = np.full(len(pois), np.nan)
+    
+    for i, poi in enumerate(pois):
+        coords = get_poi_coordinates(poi)
+        if coords:
+            lats[i], lons[i] = coords
+    
+    return lats, lons, np.cos(np.radians(lats))
+
+
 def select_base_cities(start_city, end_city, days, city_scores, centroids, max_km_per_day=300):
     """
     Select 2-4 strategic base cities for the road trip
@@ -253,7 +313,7 @@ def select_base_cities(start_city, end_city, days, city_scores, centroids, max_k
     # Get candidates sorted by score
     candidates = [(norm, score) for norm, score in city_scores 
                   if norm != start_city_norm and norm != end_city_norm]
-    candidates.sort(key=lambda x: x[1], reverse=True)
+    candidates.sort(key=operator.itemgetter(1), reverse=True)
     
     for city_norm, _ in candidates:
         if remaining_bases <= 0:
@@ -332,31 +392,42 @@ def allocate_nights_to_bases(bases, total_days):
     return allocation
 
 
-def get_attractions_within_radius(base_city_norm, all_attractions, centroids, max_radius_km=80):
+def get_attraction_distances(base_city_norm, all_attractions, centroids, max_radius_km=80, coords=None):
     """
-    Get all attractions within driving radius of base city
+    Get (attraction, distance_km) for every attraction within driving radius of base city
     
-    For car travel, we can reach attractions up to 80km away (1-1.5h drive)
+    The attraction dicts are returned as-is, not copied.
+    coords is the poi_coordinate_arrays() of all_attractions, if already built.
     """
     base_centroid = centroids.get(base_city_norm)
     if not base_centroid:
         return []
     
-    nearby_attractions = []
+    lats, lons, cos_lats = coords if coords is not None else poi_coordinate_arrays(all_attractions)
+    distances = haversine_km_vec(base_centroid, lats, lons, cos_lats=cos_lats)
     
-    for attr in all_attractions:
-        coords = get_poi_coordinates(attr)
-        if not coords:
-            continue
-        
-        distance = haversine_km(base_centroid, coords)
-        if distance and distance <= max_radius_km:
-            attr_copy = attr.copy()
-            attr_copy['distance_from_base'] = round(distance, 1)
-            attr_copy['driving_time_hours'] = round(calculate_driving_time(distance), 1)
-            nearby_attractions.append(attr_copy)
+    # Zero distance is skipped, as haversine_km's falsy check always did
+    return [(all_attractions[i], float(distances[i]))
+            for i in np.flatnonzero((distances > 0) & (distances <= max_radius_km))]
+
+
+def with_base_distance(attr, distance):
+    """Copy of an attraction with its distance and driving time from the base"""
+    attr_copy = attr.copy()
+    attr_copy['distance_from_base'] = round(distance, 1)
+    attr_copy['driving_time_hours'] = round(calculate_driving_time(distance), 1)
+    return attr_copy
+
+
+def get_attractions_within_radius(base_city_norm, all_attractions, centroids, max_radius_km=80, coords=None):
+    """
+    Get all attractions within driving radius of base city
     
-    return nearby_attractions
+    For car travel, we can reach attractions up to 80km away (1-1.5h drive)
+    """
+    return [with_base_distance(attr, distance)
+            for attr, distance in get_attraction_distances(base_city_norm, all_attractions, centroids,
+                                                           max_radius_km, coords)]
 
 
 def cluster_attractions_by_area(attractions, centroids, base_centroid):
@@ -376,33 +447,33 @@ def cluster_attractions_by_area(attractions, centroids, base_centroid):
     
     clusters = []
     current_cluster = []
+    cluster_coords = []  # Coordinates of the current cluster's members, kept in step
     
     for attr in attractions_sorted:
+        # Each attraction's coordinates are looked up once, when it is reached
+        attr_coords = get_poi_coordinates(attr)
+        
         if not current_cluster:
             current_cluster.append(attr)
+            cluster_coords = [attr_coords] if attr_coords else []
             continue
         
         # Check if this attraction is close to cluster
-        cluster_coords = [get_poi_coordinates(a) for a in current_cluster]
-        attr_coords = get_poi_coordinates(attr)
-        
         if attr_coords:
             # Find closest attraction in cluster
-            min_distance = float('inf')
-            for c_coords in cluster_coords:
-                if c_coords:
-                    dist = haversine_km(attr_coords, c_coords)
-                    if dist < min_distance:
-                        min_distance = dist
+            min_distance = min((haversine_km(attr_coords, c_coords) for c_coords in cluster_coords),
+                               default=float('inf'))
             
             # If within 20km of cluster, add to it
             if min_distance < 20:
                 current_cluster.append(attr)
+                cluster_coords.append(attr_coords)
             else:
                 # Start new cluster
                 if len(current_cluster) >= 2:  # Only keep clusters with 2+ attractions
                     clusters.append(current_cluster)
                 current_cluster = [attr]
+                cluster_coords = [attr_coords]
     
     # Add last cluster
     if len(current_cluster) >= 2:
@@ -486,6 +557,10 @@ def generate_simple_trip(start_end_text, days, prefs, trip_type, attractions, ho
     
     st.info(f"🚗 Planning road trip: {start_city} → {end_city} ({days} days)")
     
+    # Requested cities, normalized once for set lookups
+    avoid_norm = {normalize_city_name(c) for c in parsed_requests['avoid_cities']}
+    must_see_norm = {normalize_city_name(c) for c in parsed_requests['must_see_cities']}
+    
     # Filter attractions
     filtered = []
     for a in attractions:
@@ -496,19 +571,13 @@ def generate_simple_trip(start_end_text, days, prefs, trip_type, attractions, ho
         if not name or not is_valid_attraction(a):
             continue
         
-        if parsed_requests['avoid_cities']:
-            should_skip = any(
-                normalize_city_name(avoid) == normalize_city_name(city)
-                for avoid in parsed_requests['avoid_cities']
-            )
-            if should_skip:
-                continue
+        city_norm = normalize_city_name(city)
+        
+        if city_norm in avoid_norm:
+            continue
         
         if rating is None or rating == 0 or rating >= min_rating:
-            is_must_see_city = any(
-                normalize_city_name(must_see) == normalize_city_name(city)
-                for must_see in parsed_requests['must_see_cities']
-            )
+            is_must_see_city = city_norm in must_see_norm
             
             is_must_see_attraction = any(
                 must_see.lower() in name.lower()
@@ -521,10 +590,14 @@ def generate_simple_trip(start_end_text, days, prefs, trip_type, attractions, ho
             
             filtered.append(a)
     
-    filtered.sort(key=lambda x: x.get('priority', 0), reverse=True)
+    # Every filtered attraction has a priority, so a C-level itemgetter will do
+    filtered.sort(key=operator.itemgetter('priority'), reverse=True)
     
     centroids = compute_city_centroids(filtered, hotels)
     
+    # Coordinates of every filtered POI, reused for each base's radius search
+    filtered_coords = poi_coordinate_arrays(filtered)
+    
     # Group by city
     by_city_normalized = {}
     city_name_map = {}
@@ -553,7 +626,7 @@ def generate_simple_trip(start_end_text, days, prefs, trip_type, attractions, ho
         score = (must_see_count * 100) + total_priority + len(attrs)
         city_scores.append((city_norm, score))
     
-    city_scores.sort(key=lambda x: x[1], reverse=True)
+    city_scores.sort(key=operator.itemgetter(1), reverse=True)
     
     # 🚗 STEP 1: Select base cities
     base_cities_norm = select_base_cities(
@@ -593,6 +666,11 @@ def generate_simple_trip(start_end_text, days, prefs, trip_type, attractions, ho
     }
     poi_quota = POI_QUOTA_CAR.get(pace, 4)
     
+    # Hotel positions grouped by city, built once for every base's lookup
+    hotel_positions = defaultdict(list)
+    for i, h in enumerate(hotels):
+        hotel_positions[h.get("city", "")].append(i)
+    
     for idx, base_norm in enumerate(base_cities_norm):
         base_name = city_name_map.get(base_norm, base_norm)
         nights = night_allocation.get(base_norm, 1)
@@ -601,29 +679,58 @@ def generate_simple_trip(start_end_text, days, prefs, trip_type, attractions, ho
         print(f"\n🏨 Planning {nights} days in {base_name}...")
         
         # Get attractions within 80km radius
-        nearby_attractions = get_attractions_within_radius(
+        nearby_attractions = get_attraction_distances(
             base_norm,
             filtered,
             centroids,
-            max_radius_km=80
+            max_radius_km=80,
+            coords=filtered_coords
         )
         
         print(f"  Found {len(nearby_attractions)} attractions within 80km")
         
+        # Only the POIs picked for a day are copied with their distance
+        # fields, once per base so a POI picked twice is the same dict
+        base_distances = {}
+        picked_copies = {}
+        
+        def picked(pois):
+            result = []
+            for poi in pois:
+                poi_copy = picked_copies.get(id(poi))
+                if poi_copy is None:
+                    poi_copy = picked_copies[id(poi)] = with_base_distance(poi, base_distances[id(poi)])
+                result.append(poi_copy)
+            return result
+        
+        # Split the nearby attractions once per base: the base city itself
+        # (< 10km) and day-trip range (10-80km, grouped by city). Every day
+        # spent at this base picks from these same lists
+        base_city_attrs = []
+        day_trip_attrs = []
+        city_groups = defaultdict(list)
+        for a, distance_km in nearby_attractions:
+            base_distances[id(a)] = distance_km
+            distance = round(distance_km, 1)
+            if distance < 10:
+                base_city_attrs.append(a)
+            elif distance <= 80:
+                day_trip_attrs.append(a)
+                city = a.get('city', '')
+                if city:
+                    city_groups[city].append(a)
+        
         # Day 1 at base: Explore the base city itself
         if day_counter <= days:
-            base_city_attrs = [a for a in nearby_attractions if a.get('distance_from_base', 999) < 10]
-            
-            selected = apply_diversity(base_city_attrs, poi_quota, max_same_cat)
+            selected = picked(apply_diversity(base_city_attrs, poi_quota, max_same_cat))
             
             if len(selected) < 3:
-                selected = sorted(base_city_attrs, key=lambda x: x.get('rating') or 0, reverse=True)[:poi_quota]
+                selected = picked(sorted(base_city_attrs, key=lambda x: x.get('rating') or 0, reverse=True)[:poi_quota])
             
-            # Get hotels
-            city_hotels = []
-            for h in hotels:
-                if cities_match(h.get("city", ""), base_name):
-                    city_hotels.append(h)
+            # Get hotels: match each distinct hotel city once, keeping the hotels' original order
+            matched = [i for city, positions in hotel_positions.items()
+                       if cities_match(city, base_name) for i in positions]
+            city_hotels = [hotels[i] for i in sorted(matched)]
             
             if not city_hotels:
                 city_hotels = [{
@@ -657,7 +764,7 @@ def generate_simple_trip(start_end_text, days, prefs, trip_type, attractions, ho
                 "cities": [{"city": base_name, "attractions": selected}],
                 "overnight_city": base_name,
                 "hotels": top_hotels,
-                "is_must_see": any(normalize_city_name(m) == base_norm for m in parsed_requests['must_see_cities']),
+                "is_must_see": base_norm in must_see_norm,
                 "driving_km": driving_km if is_driving_day else 0,
                 "driving_hours": driving_hours if is_driving_day else 0,
                 "walking_distance_km": None
@@ -672,13 +779,9 @@ def generate_simple_trip(start_end_text, days, prefs, trip_type, attractions, ho
             if day_counter > days:
                 break
             
-            # Get attractions 10-80km away (day trip range)
-            day_trip_attrs = [a for a in nearby_attractions if 10 <= a.get('distance_from_base', 999) <= 80]
-            
             if not day_trip_attrs:
                 # No day trips available, stay in base city
-                base_city_attrs = [a for a in nearby_attractions if a.get('distance_from_base', 999) < 10]
-                selected = apply_diversity(base_city_attrs, poi_quota, max_same_cat)
+                selected = picked(apply_diversity(base_city_attrs, poi_quota, max_same_cat))
                 
                 itinerary.append({
                     "day": day_counter,
@@ -696,13 +799,6 @@ def generate_simple_trip(start_end_text, days, prefs, trip_type, attractions, ho
                 print(f"  Day {day_counter}: Continue exploring {base_name}")
             else:
                 # ✨ NEW: Smart multi-city day trip planning
-                from collections import defaultdict
-                city_groups = defaultdict(list)
-                for attr in day_trip_attrs:
-                    city = attr.get('city', '')
-                    if city:
-                        city_groups[city].append(attr)
-                
                 # Check if any single city has enough POIs
                 single_city_ok = None
                 for city, attrs in city_groups.items():
@@ -713,7 +809,7 @@ def generate_simple_trip(start_end_text, days, prefs, trip_type, attractions, ho
                 if single_city_ok:
                     # Single city is sufficient
                     city, attrs = single_city_ok
-                    selected = apply_diversity(attrs, poi_quota, max_same_cat)
+                    selected = picked(apply_diversity(attrs, poi_quota, max_same_cat))
                     avg_distance = sum(a.get('distance_from_base', 0) for a in selected) / len(selected)
                     driving_km = round(avg_distance * 2)
                     driving_hours = round(calculate_driving_time(driving_km), 1)
@@ -746,8 +842,8 @@ def generate_simple_trip(start_end_text, days, prefs, trip_type, attractions, ho
                         quota1 = max(2, round(poi_quota * len(attrs1) / total))
                         quota2 = poi_quota - quota1
                         
-                        selected1 = apply_diversity(attrs1, min(quota1, len(attrs1)), max_same_cat)
-                        selected2 = apply_diversity(attrs2, min(quota2, len(attrs2)), max_same_cat)
+                        selected1 = picked(apply_diversity(attrs1, min(quota1, len(attrs1)), max_same_cat))
+                        selected2 = picked(apply_diversity(attrs2, min(quota2, len(attrs2)), max_same_cat))
                         
                         # Calculate distance
                         avg1 = sum(a.get('distance_from_base', 0) for a in selected1) / max(len(selected1), 1)
@@ -776,7 +872,7 @@ def generate_simple_trip(start_end_text, days, prefs, trip_type, attractions, ho
                     elif sorted_cities:
                         # Only 1 city - use what we have
                         city, attrs = sorted_cities[0]
-                        selected = apply_diversity(attrs, min(poi_quota, len(attrs)), max_same_cat)
+                        selected = picked(apply_diversity(attrs, min(poi_quota, len(attrs)), max_same_cat))
                         avg_distance = sum(a.get('distance_from_base', 0) for a in selected) / max(len(selected), 1)
                         driving_km = round(avg_distance * 2)
                         driving_hours = round(calculate_driving_time(driving_km), 1)
@@ -796,8 +892,7 @@ def generate_simple_trip(start_end_text, days, prefs, trip_type, attractions, ho
                     
                     else:
                         # Fallback to base city
-                        base_city_attrs = [a for a in nearby_attractions if a.get('distance_from_base', 999) < 10]
-                        selected_fallback = apply_diversity(base_city_attrs, poi_quota, max_same_cat)
+                        selected_fallback = picked(apply_diversity(base_city_attrs, poi_quota, max_same_cat))
                         
                         itinerary.append({
                             "day": day_counter,
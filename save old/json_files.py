@@ -0,0 +1,44 @@
+"""
+JSON file helpers shared by the app pages and the saved-trips index
+"""
+import json
+import mmap
+import os
+
+# orjson parses the large data files several times faster; optional
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def read_json_file(filepath):
+    """Parse a JSON file, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        # Parse straight from the memory-mapped file so the raw text isn't
+        # held as a second in-memory copy next to the parsed objects
+        with open(filepath, 'rb') as f:
+            # A 0-byte file can't be mapped; parse it directly so it fails
+            # with the same JSONDecodeError as the json fallback
+            if os.fstat(f.fileno()).st_size == 0:
+                return orjson.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+    
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json_file(filepath, data):
+    """Write a JSON file atomically, using orjson when it is installed"""
+    # Write to a temp file and swap it in, so a crash mid-write can't
+    # leave a truncated file behind
+    tmp_path = filepath + '.tmp'
+    if ORJSON_AVAILABLE:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, filepath)
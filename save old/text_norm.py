@@ -2,8 +2,16 @@
 """
 Text normalization utilities for handling accents and city name variations
 """
-import unicodedata
+import functools
 import re
+import sys
+import unicodedata
+
+# Accented Latin letters -> ASCII, applied in one C-level str.translate pass
+_ACCENT_TABLE = str.maketrans(
+    'áàâäãéèêëíìîïóòôöõúùûüñçÁÀÂÄÃÉÈÊËÍÌÎÏÓÒÔÖÕÚÙÛÜÑÇ',
+    'aaaaaeeeeiiiiooooouuuuncAAAAAEEEEIIIIOOOOOUUUUNC'
+)
 
 def strip_accents(s):
     """Remove accents from string"""
@@ -19,6 +27,19 @@ def norm_key(s):
     s = re.sub(r"\s+", " ", s)
     return s
 
+@functools.lru_cache(maxsize=1024)
+def normalize_city_name(city_name):
+    """Normalize city name for matching (cached: the same cities recur)"""
+    if not city_name:
+        return ""
+    without_accents = str(city_name).translate(_ACCENT_TABLE)
+    if not without_accents.isascii():
+        # Accents outside the table: strip combining marks the slow way
+        without_accents = strip_accents(without_accents)
+    # Interned, so lookups in the city tables (whose literal keys are
+    # interned too) and the visited-cities set match on identity
+    return sys.intern(without_accents.lower().strip())
+
 # Common aliases - using ASCII names that we'll convert
 CITY_ALIASES = {
     "malaga": "Malaga",  # Will be matched to Málaga in dataset
@@ -11,6 +11,7 @@ from itinerary_generator_car import generate_simple_trip
 from document_generator import build_word_doc
 from restaurant_service import get_restaurant_tips
 from text_norm import canonicalize_city, norm_key  # ✅ NEW: Import text normalization
+from trips_index import add_trip_to_index
 
 # Configuration
 TRIPS_DIR = "trips"
@@ -681,4 +682,6 @@ def save_trip(result, prefs, ordered_cities, days):
     with open(fname, "w", encoding="utf-8") as f:
         json.dump(payload, f, ensure_ascii=False, indent=2)
     
+    add_trip_to_index(TRIPS_DIR, fname, payload)
+    
     st.success(f"✅ Saved road trip: {fname}")
\ No newline at end of file
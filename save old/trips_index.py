@@ -0,0 +1,83 @@
+"""
+Summary index of saved trips (trips/_index.json)
+
+The My Trips page renders from this single file instead of opening every
+saved trip. The trip planner appends an entry whenever it saves a trip.
+"""
+import json
+import os
+import threading
+
+import streamlit as st
+
+from json_files import write_json_file
+
+INDEX_FILENAME = "_index.json"
+
+# Streamlit sessions run in threads of one process; this keeps two of them
+# from writing the index (and its temp file) at the same time
+_INDEX_LOCK = threading.Lock()
+
+
+def trip_summary(file_name, trip_data):
+    """Summary fields shown in the My Trips list for one saved trip"""
+    return {
+        "file": file_name,
+        "start_end_text": trip_data.get("start_end_text", "Unknown"),
+        "created_at": trip_data.get("created_at", "Unknown date"),
+        "days": trip_data.get("days", "?"),
+        "ordered_cities": trip_data.get("ordered_cities", []),
+        "budget": trip_data.get("preferences", {}).get("budget", "?"),
+    }
+
+
+def build_trips_index(trips_dir):
+    """Rebuild the index from every saved trip file and write it"""
+    # scandir entries carry their stat info, so ordering by mtime (oldest
+    # first, the same order appends produce) costs no extra syscalls
+    with os.scandir(trips_dir) as it:
+        entries = [e for e in it
+                   if e.name.endswith(".json") and e.name != INDEX_FILENAME and e.is_file()]
+    entries.sort(key=lambda e: e.stat().st_mtime)
+
+    index = []
+    for entry in entries:
+        try:
+            with open(entry.path, "r", encoding="utf-8") as f:
+                index.append(trip_summary(entry.name, json.load(f)))
+        except Exception as e:
+            st.warning(f"⚠️ Skipping unreadable trip {entry.name}: {e}")
+
+    with _INDEX_LOCK:
+        _write_index(trips_dir, index)
+    return index
+
+
+def add_trip_to_index(trips_dir, trip_path, trip_data):
+    """Append a newly saved trip to the index"""
+    index_path = os.path.join(trips_dir, INDEX_FILENAME)
+
+    # Read-modify-write under the lock, so concurrent saves don't drop
+    # each other's entries
+    with _INDEX_LOCK:
+        # No index yet: the My Trips page rebuilds it from all files (this
+        # one included) on its next visit
+        if not os.path.exists(index_path):
+            return
+
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except Exception:
+            # Unreadable index: drop it so it gets rebuilt
+            os.remove(index_path)
+            return
+
+        index.append(trip_summary(os.path.basename(trip_path), trip_data))
+        _write_index(trips_dir, index)
+
+
+def _write_index(trips_dir, index):
+    # Atomic (temp file + os.replace): a crash mid-write never leaves a
+    # truncated index for the My Trips page to serve
+    write_json_file(os.path.join(trips_dir, INDEX_FILENAME), index)